@@ -121,3 +121,9 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# DiscountUsage retention (see `python manage.py archive_discount_usage`)
+# Rows older than this many days are rolled into monthly summaries and archived.
+DISCOUNT_USAGE_RETENTION_DAYS = 90
+DISCOUNT_USAGE_ARCHIVE_DIR = BASE_DIR / 'archive' / 'discount_usage'
+DISCOUNT_USAGE_ARCHIVE_BATCH_SIZE = 1000
@@ -6,12 +6,16 @@ class CampaignAdmin(admin.ModelAdmin):
     list_display = (
         'name', 
         'discount_type', 
+        'value_type',
         'discount_value', 
+        'max_discount_amount',
         'start_date', 
         'end_date', 
         'total_budget', 
         'used_budget', 
         'daily_usage_limit',
+        'weekly_usage_limit',
+        'monthly_usage_limit',
         'is_active',  # Display the active status of the campaign
     )
     list_filter = ('discount_type', 'start_date', 'end_date')
@@ -0,0 +1,91 @@
+from datetime import timedelta
+from decimal import Decimal, ROUND_FLOOR
+
+from django.db.models import F, Sum
+
+from .models import CampaignDailyStats
+
+# Number of trailing days used to estimate the current spend rate
+BURN_RATE_WINDOW_DAYS = 7
+
+TWO_PLACES = Decimal('0.01')
+
+
+def record_redemption(campaign, day, discount_amount, new_customer):
+    """
+    Add one redemption to the campaign's rollup row for `day`.
+
+    `new_customer` should be True on the customer's first redemption of the day,
+    which is what keeps `unique_customers` exact without a COUNT(DISTINCT ...).
+    """
+    stats, created = CampaignDailyStats.objects.get_or_create(campaign=campaign, day=day)
+    CampaignDailyStats.objects.filter(pk=stats.pk).update(
+        redemptions=F('redemptions') + 1,
+        unique_customers=F('unique_customers') + (1 if new_customer else 0),
+        discount_spent=F('discount_spent') + discount_amount,
+    )
+
+
+def burn_rate_projection(campaign, today):
+    """
+    Project when the campaign's budget runs out from its daily spend series.
+
+    The spend rate is the average over the trailing BURN_RATE_WINDOW_DAYS
+    (or fewer, for campaigns younger than that), counting days without
+    redemptions as zero: discount_spent is summed in the database over the
+    rollup rows inside the window and divided by the window length. The
+    estimated days to exhaustion are rounded down, so the projection errs early.
+    """
+    campaign_start = campaign.start_date.date()
+    window_days = max(1, min(BURN_RATE_WINDOW_DAYS, (today - campaign_start).days + 1))
+    window_start = today - timedelta(days=window_days - 1)
+
+    window_spend = campaign.daily_stats.filter(
+        day__gte=window_start,
+        day__lte=today,
+    ).aggregate(spent=Sum('discount_spent'))['spent'] or Decimal('0')
+    average_daily_spend = window_spend / window_days
+    remaining_budget = max(campaign.total_budget - campaign.used_budget, Decimal('0'))
+    days_left = max((campaign.end_date.date() - today).days, 0)
+
+    if average_daily_spend > 0:
+        days_to_exhaustion = (remaining_budget / average_daily_spend).to_integral_value(rounding=ROUND_FLOOR)
+        projected_exhaustion_date = today + timedelta(days=int(days_to_exhaustion))
+    else:
+        days_to_exhaustion = None
+        projected_exhaustion_date = None
+    # Spend can never be projected past the budget, whatever the rate
+    projected_spend_at_end = min(
+        campaign.used_budget + average_daily_spend * days_left,
+        campaign.total_budget,
+    )
+
+    return {
+        'window_days': window_days,
+        'average_daily_spend': average_daily_spend.quantize(TWO_PLACES),
+        'remaining_budget': remaining_budget.quantize(TWO_PLACES),
+        'days_to_exhaustion': int(days_to_exhaustion) if days_to_exhaustion is not None else None,
+        'projected_exhaustion_date': projected_exhaustion_date,
+        # True when the budget is projected to run out before end_date
+        'exhausts_before_end': projected_exhaustion_date is not None and projected_exhaustion_date < campaign.end_date.date(),
+        'projected_spend_at_end': Decimal(projected_spend_at_end).quantize(TWO_PLACES),
+    }
+
+
+def campaign_stats(campaign, today):
+    """
+    Build the stats payload for a campaign entirely from its CampaignDailyStats rows.
+
+    Totals and the burn-rate window are aggregated in the database; the
+    daily series is returned as a lazy queryset for the caller to serialize.
+    """
+    totals = campaign.daily_stats.aggregate(
+        redemptions=Sum('redemptions'),
+        discount_spent=Sum('discount_spent'),
+    )
+    return {
+        'daily_stats': campaign.daily_stats.all(),
+        'total_redemptions': totals['redemptions'] or 0,
+        'total_discount_spent': totals['discount_spent'] or Decimal('0'),
+        'burn_rate': burn_rate_projection(campaign, today),
+    }
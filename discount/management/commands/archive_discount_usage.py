@@ -0,0 +1,63 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from discount.models import DiscountUsage
+from discount.retention import archive_discount_usage, retention_cutoff
+
+
+class Command(BaseCommand):
+    help = (
+        "Roll DiscountUsage rows older than the retention window into monthly "
+        "per-campaign summaries, archive them to compressed JSONL files and "
+        "delete them in small batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=settings.DISCOUNT_USAGE_RETENTION_DAYS,
+            help="Keep rows from the last N days in the hot table",
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.DISCOUNT_USAGE_ARCHIVE_BATCH_SIZE,
+            help="Rows summarised, archived and deleted per transaction",
+        )
+        parser.add_argument(
+            '--archive-dir',
+            default=str(settings.DISCOUNT_USAGE_ARCHIVE_DIR),
+            help="Directory for the .jsonl.gz archive files",
+        )
+        parser.add_argument(
+            '--no-archive',
+            action='store_true',
+            help="Only summarise and delete; do not write raw rows to disk",
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help="Report how many rows would be archived without changing anything",
+        )
+
+    def handle(self, *args, **options):
+        if options['days'] < 1:
+            raise CommandError("--days must be at least 1 (today's rows record usage and flag first redemptions for unique_customers).")
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        cutoff = retention_cutoff(options['days'])
+
+        if options['dry_run']:
+            count = DiscountUsage.objects.filter(used_on__lt=cutoff).count()
+            self.stdout.write(f"{count} usage rows older than {cutoff} would be archived.")
+            return
+
+        archive_dir = None if options['no_archive'] else options['archive_dir']
+        stats = archive_discount_usage(cutoff, archive_dir=archive_dir, batch_size=options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Archived {stats['rows']} usage rows older than {cutoff} "
+            f"in {stats['batches']} batches ({len(stats['files'])} archive files)."
+        ))
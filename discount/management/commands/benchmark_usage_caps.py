@@ -0,0 +1,120 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from discount.models import Campaign, CustomerUsageCounter, DiscountUsage
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare checking daily/weekly/monthly usage caps with SUM queries over "
+        "DiscountUsage against a single CustomerUsageCounter lookup. "
+        "Seeds synthetic data inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--customers', type=int, default=200, help="Number of synthetic customers")
+        parser.add_argument('--days', type=int, default=365, help="Days of usage history per customer")
+        parser.add_argument('--iterations', type=int, default=500, help="Cap checks timed per strategy")
+
+    def handle(self, *args, **options):
+        for option in ('customers', 'days', 'iterations'):
+            if options[option] < 1:
+                raise CommandError(f"--{option} must be a positive integer.")
+
+        with transaction.atomic():
+            campaign, customers = self.seed(options['customers'], options['days'])
+            naive = self.time_checks(options['iterations'], customers, lambda c: self.naive_check(campaign, c))
+            counter = self.time_checks(options['iterations'], customers, lambda c: self.counter_check(campaign, c))
+            transaction.set_rollback(True)
+
+        rows = options['customers'] * options['days']
+        self.stdout.write(f"History: {rows} DiscountUsage rows, {options['iterations']} checks per strategy")
+        self.stdout.write(f"Naive SUM over DiscountUsage: {naive * 1e6:10.1f} us/check")
+        self.stdout.write(f"CustomerUsageCounter lookup:  {counter * 1e6:10.1f} us/check")
+        if counter:
+            self.stdout.write(self.style.SUCCESS(f"Speed-up: {naive / counter:.1f}x"))
+
+    def seed(self, customer_count, days):
+        now = timezone.now()
+        today = now.date()
+        campaign = Campaign.objects.create(
+            name="Usage cap benchmark",
+            discount_type='cart',
+            discount_value=10,
+            start_date=now - timezone.timedelta(days=days),
+            end_date=now + timezone.timedelta(days=1),
+            total_budget=10 ** 6,
+            daily_usage_limit=5,
+            weekly_usage_limit=20,
+            monthly_usage_limit=60,
+        )
+        User.objects.bulk_create(
+            User(username=f"usage-cap-benchmark-{i}") for i in range(customer_count)
+        )
+        customers = list(User.objects.filter(username__startswith="usage-cap-benchmark-"))
+
+        # used_on is auto_now_add, which bulk_create does not apply, so set it explicitly
+        DiscountUsage.objects.bulk_create(
+            (
+                DiscountUsage(
+                    campaign=campaign,
+                    customer=customer,
+                    used_on=today - timezone.timedelta(days=offset),
+                    transaction_count=1,
+                )
+                for customer in customers
+                for offset in range(days)
+            ),
+            batch_size=1000,
+        )
+
+        day, week_start, month_start = CustomerUsageCounter.window_starts(today)
+        CustomerUsageCounter.objects.bulk_create(
+            (
+                CustomerUsageCounter(
+                    campaign=campaign,
+                    customer=customer,
+                    day=day,
+                    day_count=1,
+                    week_start=week_start,
+                    week_count=today.weekday() + 1,
+                    month_start=month_start,
+                    month_count=today.day,
+                )
+                for customer in customers
+            ),
+            batch_size=1000,
+        )
+        return campaign, customers
+
+    def time_checks(self, iterations, customers, check):
+        start = time.perf_counter()
+        for i in range(iterations):
+            check(customers[i % len(customers)])
+        return (time.perf_counter() - start) / iterations
+
+    def naive_check(self, campaign, customer):
+        day, week_start, month_start = CustomerUsageCounter.window_starts(timezone.now().date())
+        usages = DiscountUsage.objects.filter(campaign=campaign, customer=customer)
+        daily = usages.filter(used_on=day).aggregate(n=Sum('transaction_count'))['n'] or 0
+        weekly = usages.filter(used_on__gte=week_start).aggregate(n=Sum('transaction_count'))['n'] or 0
+        monthly = usages.filter(used_on__gte=month_start).aggregate(n=Sum('transaction_count'))['n'] or 0
+        return (
+            daily < campaign.daily_usage_limit
+            and weekly < campaign.weekly_usage_limit
+            and monthly < campaign.monthly_usage_limit
+        )
+
+    def counter_check(self, campaign, customer):
+        counter = CustomerUsageCounter.objects.get(campaign=campaign, customer=customer)
+        counter.roll_to(timezone.now().date())
+        return (
+            counter.day_count < campaign.daily_usage_limit
+            and counter.week_count < campaign.weekly_usage_limit
+            and counter.month_count < campaign.monthly_usage_limit
+        )
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('discount', '0003_discountusage'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DiscountUsageMonthlySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='First day of the summarised month')),
+                ('transaction_count', models.IntegerField(default=0, help_text='Total discount uses in the month')),
+                ('customer_days', models.IntegerField(default=0, help_text='Number of archived per-customer daily usage rows')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='discountusage',
+            index=models.Index(fields=['campaign', 'customer', 'used_on'], name='discount_di_campaig_1f41b4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='discountusage',
+            index=models.Index(fields=['used_on'], name='discount_di_used_on_7fe4b1_idx'),
+        ),
+        migrations.AddField(
+            model_name='discountusagemonthlysummary',
+            name='campaign',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_usage_summaries', to='discount.campaign'),
+        ),
+        migrations.AddConstraint(
+            model_name='discountusagemonthlysummary',
+            constraint=models.UniqueConstraint(fields=('campaign', 'month'), name='unique_campaign_month_summary'),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_campaign_daily_stats(apps, schema_editor):
+    """
+    Seed redemptions and unique_customers from existing DiscountUsage rows.
+
+    DiscountUsage never recorded discount amounts, so discount_spent stays 0
+    for backfilled days. Seeding today's row also keeps unique_customers exact
+    for customers who already redeemed before the deploy.
+    """
+    DiscountUsage = apps.get_model('discount', 'DiscountUsage')
+    CampaignDailyStats = apps.get_model('discount', 'CampaignDailyStats')
+
+    days = (
+        DiscountUsage.objects
+        .values('campaign_id', 'used_on')
+        .annotate(redemptions=Sum('transaction_count'), unique_customers=Count('id'))
+        .order_by()
+    )
+    CampaignDailyStats.objects.bulk_create(
+        (
+            CampaignDailyStats(
+                campaign_id=row['campaign_id'],
+                day=row['used_on'],
+                redemptions=row['redemptions'] or 0,
+                unique_customers=row['unique_customers'],
+            )
+            for row in days.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('discount', '0004_discountusage_retention'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CampaignDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('redemptions', models.IntegerField(default=0, help_text='Discount uses on this day')),
+                ('unique_customers', models.IntegerField(default=0, help_text='Distinct customers who redeemed on this day')),
+                ('discount_spent', models.DecimalField(decimal_places=2, default=0, help_text='Budget consumed on this day', max_digits=10)),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='discount.campaign')),
+            ],
+            options={
+                'ordering': ['day'],
+                'constraints': [models.UniqueConstraint(fields=('campaign', 'day'), name='unique_campaign_daily_stats')],
+            },
+        ),
+        migrations.RunPython(backfill_campaign_daily_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:53
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_usage_counters(apps, schema_editor):
+    """
+    Seed counters from the DiscountUsage rows in the current day/week/month
+    so caps take effect immediately for customers who already redeemed.
+    """
+    DiscountUsage = apps.get_model('discount', 'DiscountUsage')
+    CustomerUsageCounter = apps.get_model('discount', 'CustomerUsageCounter')
+
+    today = timezone.now().date()
+    week_start = today - timezone.timedelta(days=today.weekday())
+    month_start = today.replace(day=1)
+
+    counters = {}
+    rows = DiscountUsage.objects.filter(used_on__gte=min(week_start, month_start), used_on__lte=today)
+    for campaign_id, customer_id, used_on, count in rows.values_list('campaign_id', 'customer_id', 'used_on', 'transaction_count'):
+        counter = counters.setdefault((campaign_id, customer_id), CustomerUsageCounter(
+            campaign_id=campaign_id,
+            customer_id=customer_id,
+            day=today,
+            week_start=week_start,
+            month_start=month_start,
+        ))
+        if used_on == today:
+            counter.day_count += count
+        if used_on >= week_start:
+            counter.week_count += count
+        if used_on >= month_start:
+            counter.month_count += count
+
+    CustomerUsageCounter.objects.bulk_create(counters.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('discount', '0005_campaigndailystats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaign',
+            name='monthly_usage_limit',
+            field=models.IntegerField(blank=True, help_text='Max transactions per customer per calendar month; empty for no limit', null=True),
+        ),
+        migrations.AddField(
+            model_name='campaign',
+            name='weekly_usage_limit',
+            field=models.IntegerField(blank=True, help_text='Max transactions per customer per calendar week (Mon-Sun); empty for no limit', null=True),
+        ),
+        migrations.CreateModel(
+            name='CustomerUsageCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('day_count', models.IntegerField(default=0)),
+                ('week_start', models.DateField(help_text='Monday of the counted week')),
+                ('week_count', models.IntegerField(default=0)),
+                ('month_start', models.DateField(help_text='First day of the counted month')),
+                ('month_count', models.IntegerField(default=0)),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='usage_counters', to='discount.campaign')),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='usage_counters', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('campaign', 'customer'), name='unique_campaign_customer_counter')],
+            },
+        ),
+        migrations.RunPython(backfill_usage_counters, migrations.RunPython.noop),
+    ]
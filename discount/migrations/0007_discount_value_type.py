@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('discount', '0006_usage_caps'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaign',
+            name='max_discount_amount',
+            field=models.DecimalField(blank=True, decimal_places=2, help_text='Max discount per order; empty for no cap', max_digits=10, null=True),
+        ),
+        migrations.AddField(
+            model_name='campaign',
+            name='value_type',
+            field=models.CharField(choices=[('percentage', 'Percentage'), ('fixed', 'Fixed Amount')], default='percentage', help_text='Whether discount_value is a percentage or a fixed amount', max_length=10),
+        ),
+    ]
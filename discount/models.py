@@ -7,14 +7,22 @@ class Campaign(models.Model):
         ('cart', 'Overall Cart'),
         ('delivery', 'Delivery Charges'),
     )
+    VALUE_TYPE_CHOICES = (
+        ('percentage', 'Percentage'),
+        ('fixed', 'Fixed Amount'),
+    )
     
     name = models.CharField(max_length=255)
     discount_type = models.CharField(max_length=10, choices=DISCOUNT_TYPE_CHOICES)
+    value_type = models.CharField(max_length=10, choices=VALUE_TYPE_CHOICES, default='percentage', help_text="Whether discount_value is a percentage or a fixed amount")
     discount_value = models.DecimalField(max_digits=10, decimal_places=2, help_text="Discount value (e.g. percentage or fixed amount)")
+    max_discount_amount = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, help_text="Max discount per order; empty for no cap")
     start_date = models.DateTimeField(help_text="Campaign start date and time")
     end_date = models.DateTimeField(help_text="Campaign end date and time")
     total_budget = models.DecimalField(max_digits=10, decimal_places=2, help_text="Max total discount budget available for this campaign")
     daily_usage_limit = models.IntegerField(default=1, help_text="Max transactions per customer per day")
+    weekly_usage_limit = models.IntegerField(null=True, blank=True, help_text="Max transactions per customer per calendar week (Mon-Sun); empty for no limit")
+    monthly_usage_limit = models.IntegerField(null=True, blank=True, help_text="Max transactions per customer per calendar month; empty for no limit")
     allowed_customers = models.ManyToManyField(
         User,
         blank=True,
@@ -35,5 +43,95 @@ class DiscountUsage(models.Model):
     used_on = models.DateField(auto_now_add=True)  # date when the discount was used
     transaction_count = models.IntegerField(default=0)  # how many times user used the discount on that day
 
+    class Meta:
+        indexes = [
+            # Today's row lookup in apply_campaign_discount (usage history, first-redemption flag)
+            models.Index(fields=['campaign', 'customer', 'used_on']),
+            # Retention scan for rows older than the cutoff
+            models.Index(fields=['used_on']),
+        ]
+
+    def __str__(self):
+        return f"{self.customer.username} used {self.campaign.name} on {self.used_on} ({self.transaction_count}x)"
+
+class CustomerUsageCounter(models.Model):
+    """
+    Running day/week/month transaction counts for one customer on one campaign.
+
+    A single row per (campaign, customer) holds all three windows, so the usage
+    limits can be checked with one indexed lookup instead of summing DiscountUsage.
+    Each window is reset lazily by roll_to() when the stored window start is stale.
+    """
+    campaign = models.ForeignKey(Campaign, on_delete=models.CASCADE, related_name='usage_counters')
+    customer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='usage_counters')
+    day = models.DateField()
+    day_count = models.IntegerField(default=0)
+    week_start = models.DateField(help_text="Monday of the counted week")
+    week_count = models.IntegerField(default=0)
+    month_start = models.DateField(help_text="First day of the counted month")
+    month_count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['campaign', 'customer'], name='unique_campaign_customer_counter'),
+        ]
+
+    @staticmethod
+    def window_starts(day):
+        """
+        Return (day, week_start, month_start) for the given date.
+        """
+        return day, day - timezone.timedelta(days=day.weekday()), day.replace(day=1)
+
+    def roll_to(self, day):
+        """
+        Reset any window that `day` no longer falls into.
+        """
+        day, week_start, month_start = self.window_starts(day)
+        if self.day != day:
+            self.day, self.day_count = day, 0
+        if self.week_start != week_start:
+            self.week_start, self.week_count = week_start, 0
+        if self.month_start != month_start:
+            self.month_start, self.month_count = month_start, 0
+
+    def __str__(self):
+        return f"{self.customer.username} on {self.campaign.name}: {self.day_count}/{self.week_count}/{self.month_count}"
+
+class DiscountUsageMonthlySummary(models.Model):
+    """
+    Compact per-campaign, per-month totals of archived DiscountUsage rows.
+    Filled by the `archive_discount_usage` management command.
+    """
+    campaign = models.ForeignKey(Campaign, on_delete=models.CASCADE, related_name='monthly_usage_summaries')
+    month = models.DateField(help_text="First day of the summarised month")
+    transaction_count = models.IntegerField(default=0, help_text="Total discount uses in the month")
+    customer_days = models.IntegerField(default=0, help_text="Number of archived per-customer daily usage rows")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['campaign', 'month'], name='unique_campaign_month_summary'),
+        ]
+
+    def __str__(self):
+        return f"{self.campaign.name} {self.month:%Y-%m}: {self.transaction_count}x"
+
+class CampaignDailyStats(models.Model):
+    """
+    Pre-aggregated per-campaign, per-day redemption totals.
+    Updated incrementally by apply_campaign_discount so reports never scan DiscountUsage.
+    """
+    campaign = models.ForeignKey(Campaign, on_delete=models.CASCADE, related_name='daily_stats')
+    day = models.DateField()
+    redemptions = models.IntegerField(default=0, help_text="Discount uses on this day")
+    unique_customers = models.IntegerField(default=0, help_text="Distinct customers who redeemed on this day")
+    discount_spent = models.DecimalField(max_digits=10, decimal_places=2, default=0, help_text="Budget consumed on this day")
+
+    class Meta:
+        ordering = ['day']
+        constraints = [
+            models.UniqueConstraint(fields=['campaign', 'day'], name='unique_campaign_daily_stats'),
+        ]
+
     def __str__(self):
-        return f"{self.customer.username} used {self.campaign.name} on {self.used_on} ({self.transaction_count}x)"
\ No newline at end of file
+        return f"{self.campaign.name} on {self.day}: {self.redemptions}x"
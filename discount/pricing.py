@@ -0,0 +1,147 @@
+"""
+Discount pricing in integer minor units (paise).
+
+All amounts are ints of paise so results are exact and cheap to compute.
+Convert at the edges with to_paise() / from_paise(); everything in between
+is integer arithmetic.
+
+Percentage discounts are expressed in basis points (1/100 of a percent),
+which represents Campaign.discount_value (2 decimal places) exactly. The
+percentage result is rounded half-to-even to the nearest paisa, which is
+what round(Decimal(...), 2) does.
+"""
+from collections import namedtuple
+from decimal import Decimal, InvalidOperation, ROUND_HALF_EVEN
+
+PAISE_PER_RUPEE = 100
+BASIS_POINTS = 100 * 100  # 100% expressed in basis points
+
+# A campaign reduced to the integers needed to price an order.
+#   discount_type: 'cart' or 'delivery' (which part of the order is discounted)
+#   value_type:    'percentage' or 'fixed'
+#   value:         basis points for percentage, paise for fixed
+#   max_discount:  cap in paise, or None for no cap
+DiscountRule = namedtuple('DiscountRule', ['discount_type', 'value_type', 'value', 'max_discount'])
+
+# Result of pricing one order, in paise
+Quote = namedtuple('Quote', ['discount', 'total'])
+
+
+def to_paise(amount):
+    """
+    Convert a rupee amount (str, int, float or Decimal) to integer paise.
+
+    Floats go through str() first so 19.99 becomes 1999, not 1998.
+    Raises ValueError for values that are not numbers or that are finer
+    than one paisa (e.g. '99.995').
+    """
+    try:
+        value = Decimal(str(amount)) * PAISE_PER_RUPEE
+    except (InvalidOperation, TypeError):
+        raise ValueError(f"Invalid amount: {amount!r}")
+    if not value.is_finite():
+        raise ValueError(f"Invalid amount: {amount!r}")
+    paise = value.to_integral_value(rounding=ROUND_HALF_EVEN)
+    if paise != value:
+        raise ValueError(f"Invalid amount: {amount!r} has more than 2 decimal places")
+    return int(paise)
+
+
+def from_paise(paise):
+    """
+    Convert integer paise back to a 2-decimal-place Decimal rupee amount.
+    """
+    return Decimal(paise).scaleb(-2)
+
+
+def _div_half_even(numerator, denominator):
+    """
+    Integer division of a non-negative numerator, rounded half-to-even.
+    """
+    quotient, remainder = divmod(numerator, denominator)
+    if remainder * 2 > denominator or (remainder * 2 == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+def rule_for_campaign(campaign):
+    """
+    Build a DiscountRule from a Campaign instance.
+    """
+    # Scaling by 100 turns rupees into paise and a 2dp percentage into basis points
+    value = to_paise(campaign.discount_value)
+    max_discount = None
+    if campaign.max_discount_amount is not None:
+        max_discount = to_paise(campaign.max_discount_amount)
+    return DiscountRule(campaign.discount_type, campaign.value_type, value, max_discount)
+
+
+def _resolve(rule):
+    """
+    Reduce a rule to (use_subtotal, fixed, basis_points, cap).
+
+    `fixed` is the fixed discount in paise, or None for a percentage rule,
+    in which case `basis_points` holds the rate.
+    """
+    fixed = rule.value if rule.value_type == 'fixed' else None
+    return rule.discount_type == 'cart', fixed, rule.value, rule.max_discount
+
+
+def _discount(base, fixed, basis_points, cap):
+    """
+    Discount in paise on `base` for a resolved rule.
+
+    The discount never exceeds `base` or `cap`, and is never negative.
+    """
+    if base <= 0:
+        return 0
+    discount = fixed if fixed is not None else _div_half_even(base * basis_points, BASIS_POINTS)
+    if cap is not None and discount > cap:
+        discount = cap
+    return max(0, min(discount, base))
+
+
+def discount_for(rule, subtotal, delivery_fee):
+    """
+    Return the discount in paise for one order under one rule.
+
+    The discount never exceeds the discounted base (cart subtotal or
+    delivery fee) or the rule's max_discount, and is never negative.
+    """
+    use_subtotal, fixed, basis_points, cap = _resolve(rule)
+    base = subtotal if use_subtotal else delivery_fee
+    return _discount(base, fixed, basis_points, cap)
+
+
+def quote(rule, subtotal, delivery_fee):
+    """
+    Price one order (subtotal and delivery fee in paise) under one rule.
+    """
+    discount = discount_for(rule, subtotal, delivery_fee)
+    return Quote(discount, subtotal + delivery_fee - discount)
+
+
+def quote_campaigns(rules, subtotal, delivery_fee):
+    """
+    Price one order against many rules, e.g. to pick the best campaign.
+
+    Returns one Quote per rule, in the same order.
+    """
+    return [quote(rule, subtotal, delivery_fee) for rule in rules]
+
+
+def quote_orders(rule, orders):
+    """
+    Price many (subtotal, delivery_fee) orders against one rule.
+
+    The rule is resolved once up front; each order then goes through the
+    same _discount() helper as discount_for().
+
+    Returns one Quote per order, in the same order.
+    """
+    use_subtotal, fixed, basis_points, cap = _resolve(rule)
+    quotes = []
+    for subtotal, delivery_fee in orders:
+        discount = _discount(subtotal if use_subtotal else delivery_fee, fixed, basis_points, cap)
+        quotes.append(Quote(discount, subtotal + delivery_fee - discount))
+    return quotes
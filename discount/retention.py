@@ -0,0 +1,158 @@
+import gzip
+import json
+import os
+from collections import defaultdict
+from datetime import timedelta
+from pathlib import Path
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import DiscountUsage, DiscountUsageMonthlySummary
+
+
+def retention_cutoff(retention_days, today=None):
+    """
+    Return the first date whose DiscountUsage rows must stay in the hot table.
+
+    Everything older than `retention_days` is eligible for archival. Usage
+    limits are checked against CustomerUsageCounter, and apply_campaign_discount
+    only reads today's DiscountUsage row (to flag a customer's first redemption
+    of the day), so anything before today is safe to move out.
+    """
+    today = today or timezone.now().date()
+    return today - timedelta(days=retention_days)
+
+
+def _summarise(rows):
+    """
+    Group a batch of usage rows into {(campaign_id, month): [transactions, customer_days]}.
+    """
+    totals = defaultdict(lambda: [0, 0])
+    for row in rows:
+        month = row['used_on'].replace(day=1)
+        bucket = totals[(row['campaign_id'], month)]
+        bucket[0] += row['transaction_count']
+        bucket[1] += 1
+    return totals
+
+
+def _stage_archive(archive_dir, rows):
+    """
+    Write one batch of raw rows as a gzip-compressed JSONL file.
+
+    The file is written under a `.partial` name and only renamed into place
+    by _publish_archive() once the batch's delete has committed. Returns the
+    (staged_path, final_path) pair.
+    """
+    path = Path(archive_dir) / f"discount_usage_{rows[0]['id']:012d}_{rows[-1]['id']:012d}.jsonl.gz"
+    staged = path.with_name(path.name + '.partial')
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(staged, 'wt', encoding='utf-8') as fh:
+        for row in rows:
+            fh.write(json.dumps({
+                'id': row['id'],
+                'campaign_id': row['campaign_id'],
+                'customer_id': row['customer_id'],
+                'used_on': row['used_on'].isoformat(),
+                'transaction_count': row['transaction_count'],
+            }))
+            fh.write('\n')
+    return staged, path
+
+
+def _publish_archive(staged):
+    """
+    Atomically rename a staged archive file to its final name.
+    """
+    staged_path, path = staged
+    os.replace(staged_path, path)
+    return path
+
+
+def _discard_archive(staged):
+    """
+    Remove a staged archive file whose batch did not commit.
+    """
+    staged_path, _ = staged
+    staged_path.unlink(missing_ok=True)
+
+
+def archive_discount_usage(cutoff, archive_dir=None, batch_size=1000):
+    """
+    Move DiscountUsage rows with `used_on < cutoff` out of the hot table.
+
+    Rows are processed in primary-key order, `batch_size` at a time. For each batch:
+      1. the rows are read without locks and, if `archive_dir` is set, written
+         to a staged `.jsonl.gz.partial` file,
+      2. in a short transaction, the rows are locked and re-read, their totals
+         are added to DiscountUsageMonthlySummary and they are deleted by
+         primary key,
+      3. after the transaction commits, the staged file is renamed to its
+         final `.jsonl.gz` name. If the transaction fails, it is removed.
+
+    Final archive files therefore only ever contain rows whose delete has
+    committed, so every row appears in exactly one file regardless of batch
+    size or how often the command is re-run. A `.partial` file left behind
+    means the process died between writing it and finishing the batch; its
+    rows may still be in the table and will be archived again by the next run.
+
+    Returns a dict with the number of rows archived and the archive files written.
+    """
+    stats = {'rows': 0, 'batches': 0, 'files': []}
+    fields = ('id', 'campaign_id', 'customer_id', 'used_on', 'transaction_count')
+    last_id = 0
+
+    while True:
+        # Rows before the cutoff are no longer written to, so snapshot them unlocked
+        rows = list(
+            DiscountUsage.objects
+            .filter(used_on__lt=cutoff, id__gt=last_id)
+            .order_by('id')
+            .values(*fields)[:batch_size]
+        )
+        if not rows:
+            break
+        last_id = rows[-1]['id']
+
+        staged = _stage_archive(archive_dir, rows) if archive_dir is not None else None
+        try:
+            with transaction.atomic():
+                locked = list(
+                    DiscountUsage.objects
+                    .select_for_update()
+                    .filter(id__in=[row['id'] for row in rows])
+                    .order_by('id')
+                    .values(*fields)
+                )
+                if locked != rows:
+                    # A row changed or vanished since the snapshot; archive what is actually deleted
+                    rows = locked
+                    if staged is not None:
+                        _discard_archive(staged)
+                        staged = _stage_archive(archive_dir, rows) if rows else None
+
+                for (campaign_id, month), (transactions, customer_days) in _summarise(rows).items():
+                    summary, created = DiscountUsageMonthlySummary.objects.get_or_create(
+                        campaign_id=campaign_id,
+                        month=month,
+                    )
+                    # Add rather than overwrite: a month may span several batches or runs
+                    DiscountUsageMonthlySummary.objects.filter(pk=summary.pk).update(
+                        transaction_count=F('transaction_count') + transactions,
+                        customer_days=F('customer_days') + customer_days,
+                    )
+
+                DiscountUsage.objects.filter(id__in=[row['id'] for row in rows]).delete()
+        except BaseException:
+            if staged is not None:
+                _discard_archive(staged)
+            raise
+
+        if staged is not None:
+            stats['files'].append(_publish_archive(staged))
+        stats['rows'] += len(rows)
+        stats['batches'] += 1
+
+    return stats
@@ -1,6 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
-from .models import Campaign
+from .models import Campaign, CampaignDailyStats
 
 class UserSerializer(serializers.ModelSerializer):
     """
@@ -35,12 +35,16 @@ class CampaignSerializer(serializers.ModelSerializer):
             'id',
             'name',
             'discount_type',
+            'value_type',
             'discount_value',
+            'max_discount_amount',
             'start_date',
             'end_date',
             'total_budget',
             'used_budget',
             'daily_usage_limit',
+            'weekly_usage_limit',
+            'monthly_usage_limit',
             'allowed_customers',      # nested users for read
             'allowed_customers_ids',  # IDs for write
         ]
@@ -75,3 +79,39 @@ class CampaignSerializer(serializers.ModelSerializer):
             instance.allowed_customers.set(allowed_customers)
         return instance
 
+
+class CampaignDailyStatsSerializer(serializers.ModelSerializer):
+    """
+    Serializes one day of pre-aggregated campaign redemption totals.
+    """
+    class Meta:
+        model = CampaignDailyStats
+        fields = ['day', 'redemptions', 'unique_customers', 'discount_spent']
+
+
+class BurnRateSerializer(serializers.Serializer):
+    """
+    Serializes the burn-rate projection built by analytics.burn_rate_projection.
+    """
+    window_days = serializers.IntegerField()
+    average_daily_spend = serializers.DecimalField(max_digits=10, decimal_places=2)
+    remaining_budget = serializers.DecimalField(max_digits=10, decimal_places=2)
+    days_to_exhaustion = serializers.IntegerField(allow_null=True)
+    projected_exhaustion_date = serializers.DateField(allow_null=True)
+    exhausts_before_end = serializers.BooleanField()
+    projected_spend_at_end = serializers.DecimalField(max_digits=10, decimal_places=2)
+
+
+class CampaignStatsSerializer(serializers.Serializer):
+    """
+    Serializes the campaign stats payload, rendering every amount as a 2dp string
+    like the rest of the API.
+    """
+    campaign_id = serializers.IntegerField()
+    name = serializers.CharField()
+    total_budget = serializers.DecimalField(max_digits=10, decimal_places=2)
+    used_budget = serializers.DecimalField(max_digits=10, decimal_places=2)
+    total_redemptions = serializers.IntegerField()
+    total_discount_spent = serializers.DecimalField(max_digits=10, decimal_places=2)
+    burn_rate = BurnRateSerializer()
+    daily = CampaignDailyStatsSerializer(many=True)
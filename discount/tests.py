@@ -1,11 +1,29 @@
+import csv
+import datetime
+import gzip
+import importlib
+import json
 import logging
-from django.test import TestCase
+import random
+import tempfile
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+from django.apps import apps as django_apps
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 from django.contrib.auth.models import User
 from django.utils import timezone
 from rest_framework.test import APIClient
 from rest_framework import status
-from .models import Campaign
+from rest_framework.exceptions import ValidationError
+from .models import Campaign, CampaignDailyStats, CustomerUsageCounter, DiscountUsage, DiscountUsageMonthlySummary
+from .analytics import burn_rate_projection
+from .pricing import DiscountRule, Quote, from_paise, quote, quote_campaigns, quote_orders, to_paise
+from .retention import archive_discount_usage
+from .views import apply_campaign_discount
 
 # Configure basic logging to stdout for debugging test flow
 logging.basicConfig(level=logging.DEBUG)
@@ -119,3 +137,525 @@ class CampaignAPITest(TestCase):
         self.assertFalse(any(c['name'] == "Targeted Discount" for c in response2.data))
 
         logger.debug("Finished test_targeted_campaign_only_for_specific_user")
+
+
+class DiscountUsageRetentionTest(TestCase):
+    """
+    Test suite for the DiscountUsage retention/archival subsystem.
+    """
+    def setUp(self):
+        """
+        Create a campaign, two customers and usage rows spread over several months.
+        """
+        self.user1 = User.objects.create(username='user1', email='user1@example.com')
+        self.user2 = User.objects.create(username='user2', email='user2@example.com')
+        self.campaign = Campaign.objects.create(
+            name="Cart Discount",
+            discount_type="cart",
+            discount_value=10,
+            start_date=timezone.now() - timezone.timedelta(days=365),
+            end_date=timezone.now() + timezone.timedelta(days=5),
+            total_budget=100,
+            daily_usage_limit=3
+        )
+        self.today = timezone.now().date()
+
+    def create_usage(self, customer, used_on, transaction_count):
+        # used_on is auto_now_add, so backdate it with an update
+        usage = DiscountUsage.objects.create(
+            campaign=self.campaign, customer=customer, transaction_count=transaction_count
+        )
+        DiscountUsage.objects.filter(pk=usage.pk).update(used_on=used_on)
+        return usage
+
+    def test_old_rows_are_summarised_archived_and_deleted(self):
+        """
+        Rows older than the cutoff end up in monthly summaries and archive files;
+        rows inside the retention window are left untouched.
+        """
+        self.create_usage(self.user1, datetime.date(2025, 1, 3), 2)
+        self.create_usage(self.user2, datetime.date(2025, 1, 3), 1)
+        self.create_usage(self.user1, datetime.date(2025, 1, 20), 3)
+        self.create_usage(self.user1, datetime.date(2025, 2, 1), 1)
+        recent = self.create_usage(self.user1, self.today, 1)
+
+        with tempfile.TemporaryDirectory() as archive_dir:
+            stats = archive_discount_usage(
+                datetime.date(2025, 6, 1), archive_dir=archive_dir, batch_size=3
+            )
+
+            self.assertEqual(stats['rows'], 4)
+            self.assertEqual(stats['batches'], 2)
+            archived = []
+            for path in sorted(Path(archive_dir).iterdir()):
+                with gzip.open(path, 'rt', encoding='utf-8') as fh:
+                    archived.extend(json.loads(line) for line in fh)
+            self.assertEqual(len(archived), 4)
+            self.assertEqual(archived[0]['used_on'], '2025-01-03')
+
+        self.assertEqual(list(DiscountUsage.objects.values_list('pk', flat=True)), [recent.pk])
+
+        january = DiscountUsageMonthlySummary.objects.get(campaign=self.campaign, month=datetime.date(2025, 1, 1))
+        self.assertEqual(january.transaction_count, 6)
+        self.assertEqual(january.customer_days, 3)
+        february = DiscountUsageMonthlySummary.objects.get(campaign=self.campaign, month=datetime.date(2025, 2, 1))
+        self.assertEqual(february.transaction_count, 1)
+
+    def test_failed_batch_leaves_no_archive_file(self):
+        """
+        If a batch's transaction rolls back, its staged archive file is removed
+        and the rows stay in the table, so a later run with a different batch
+        size does not archive them twice.
+        """
+        for day in (3, 4, 5):
+            self.create_usage(self.user1, datetime.date(2025, 1, day), 1)
+
+        with tempfile.TemporaryDirectory() as archive_dir:
+            with mock.patch('discount.retention._summarise', side_effect=RuntimeError("boom")):
+                with self.assertRaises(RuntimeError):
+                    archive_discount_usage(datetime.date(2025, 6, 1), archive_dir=archive_dir, batch_size=2)
+
+            self.assertEqual(list(Path(archive_dir).iterdir()), [])
+            self.assertEqual(DiscountUsage.objects.count(), 3)
+
+            stats = archive_discount_usage(datetime.date(2025, 6, 1), archive_dir=archive_dir, batch_size=3)
+            self.assertEqual(stats['rows'], 3)
+            files = list(Path(archive_dir).iterdir())
+            self.assertEqual(len(files), 1)
+            self.assertTrue(files[0].name.endswith('.jsonl.gz'))
+
+    def test_repeated_runs_accumulate_into_existing_summary(self):
+        """
+        A month split across two runs is added to, not overwritten.
+        """
+        self.create_usage(self.user1, datetime.date(2025, 3, 5), 2)
+        archive_discount_usage(datetime.date(2025, 3, 10))
+        self.create_usage(self.user1, datetime.date(2025, 3, 15), 1)
+        archive_discount_usage(datetime.date(2025, 4, 1))
+
+        summary = DiscountUsageMonthlySummary.objects.get(campaign=self.campaign)
+        self.assertEqual(summary.transaction_count, 3)
+        self.assertEqual(summary.customer_days, 2)
+
+    def test_management_command_no_archive_summarises_and_deletes(self):
+        """
+        --no-archive deletes old rows and writes summaries without creating files.
+        """
+        old_day = self.today - timezone.timedelta(days=200)
+        self.create_usage(self.user1, old_day, 2)
+        self.create_usage(self.user2, old_day, 1)
+        recent = self.create_usage(self.user1, self.today, 1)
+
+        with tempfile.TemporaryDirectory() as archive_dir:
+            out = StringIO()
+            call_command(
+                'archive_discount_usage', '--days', '90', '--no-archive',
+                '--archive-dir', archive_dir, stdout=out,
+            )
+            self.assertEqual(list(Path(archive_dir).iterdir()), [])
+
+        self.assertIn("Archived 2 usage rows", out.getvalue())
+        self.assertEqual(list(DiscountUsage.objects.values_list('pk', flat=True)), [recent.pk])
+        summary = DiscountUsageMonthlySummary.objects.get(campaign=self.campaign, month=old_day.replace(day=1))
+        self.assertEqual(summary.transaction_count, 3)
+        self.assertEqual(summary.customer_days, 2)
+
+    def test_management_command_dry_run_keeps_rows(self):
+        """
+        --dry-run only reports the number of eligible rows.
+        """
+        self.create_usage(self.user1, self.today - timezone.timedelta(days=200), 1)
+        out = StringIO()
+        call_command('archive_discount_usage', '--days', '90', '--dry-run', stdout=out)
+        self.assertIn("1 usage rows", out.getvalue())
+        self.assertEqual(DiscountUsage.objects.count(), 1)
+
+
+class CampaignStatsAPITest(TestCase):
+    """
+    Test suite for the pre-aggregated campaign analytics endpoints.
+    """
+    def setUp(self):
+        """
+        Create two customers and a 10% cart campaign that started two days ago.
+        """
+        self.client = APIClient()
+        self.user1 = User.objects.create(username='user1', email='user1@example.com')
+        self.user2 = User.objects.create(username='user2', email='user2@example.com')
+        self.campaign = Campaign.objects.create(
+            name="Cart Discount",
+            discount_type="cart",
+            discount_value=10,
+            start_date=timezone.now() - timezone.timedelta(days=2),
+            end_date=timezone.now() + timezone.timedelta(days=10),
+            total_budget=100,
+            daily_usage_limit=3
+        )
+
+    def apply_discount(self, customer, subtotal):
+        return self.client.post(reverse('apply-discount'), {
+            'subtotal': subtotal,
+            'delivery_fee': 0,
+            'campaign_id': self.campaign.id,
+            'customer': customer.id,
+        }, format='json')
+
+    def test_redemptions_update_daily_rollup(self):
+        """
+        Each redemption increments today's rollup; unique customers count each customer once.
+        """
+        self.apply_discount(self.user1, 100)
+        self.apply_discount(self.user1, 50)
+        self.apply_discount(self.user2, 20)
+
+        stats = CampaignDailyStats.objects.get(campaign=self.campaign, day=timezone.now().date())
+        self.assertEqual(stats.redemptions, 3)
+        self.assertEqual(stats.unique_customers, 2)
+        self.assertEqual(stats.discount_spent, Decimal('17.00'))
+
+    def test_migration_backfills_rollups_from_usage(self):
+        """
+        The CampaignDailyStats migration seeds redemptions and unique customers
+        from DiscountUsage, so a later redemption by the same customer is not
+        counted as a new customer.
+        """
+        today = timezone.now().date()
+        DiscountUsage.objects.create(campaign=self.campaign, customer=self.user1, transaction_count=2)
+        DiscountUsage.objects.create(campaign=self.campaign, customer=self.user2, transaction_count=1)
+
+        migration = importlib.import_module('discount.migrations.0005_campaigndailystats')
+        migration.backfill_campaign_daily_stats(django_apps, None)
+
+        stats = CampaignDailyStats.objects.get(campaign=self.campaign, day=today)
+        self.assertEqual((stats.redemptions, stats.unique_customers, stats.discount_spent), (3, 2, Decimal('0')))
+
+        self.apply_discount(self.user1, 100)
+        stats.refresh_from_db()
+        self.assertEqual((stats.redemptions, stats.unique_customers), (4, 2))
+
+    def test_stats_endpoint_reports_totals_and_burn_rate(self):
+        """
+        The stats endpoint returns the daily series, totals and a burn-rate projection.
+        """
+        today = timezone.now().date()
+        CampaignDailyStats.objects.create(
+            campaign=self.campaign, day=today - timezone.timedelta(days=2),
+            redemptions=4, unique_customers=2, discount_spent=Decimal('12.00'),
+        )
+        CampaignDailyStats.objects.create(
+            campaign=self.campaign, day=today,
+            redemptions=2, unique_customers=1, discount_spent=Decimal('6.00'),
+        )
+        self.campaign.used_budget = Decimal('18.00')
+        self.campaign.save()
+
+        response = self.client.get(reverse('campaign-stats', args=[self.campaign.id]))
+        # Read the rendered JSON; response.data never goes through the renderer
+        payload = response.json()
+        logger.debug("Stats response: %s", payload)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(payload['total_redemptions'], 6)
+        self.assertEqual(len(payload['daily']), 2)
+
+        # Every amount is a 2dp string, as in the rest of the API
+        self.assertEqual(payload['total_budget'], '100.00')
+        self.assertEqual(payload['used_budget'], '18.00')
+        self.assertEqual(payload['total_discount_spent'], '18.00')
+        self.assertEqual(payload['daily'][0]['discount_spent'], '12.00')
+
+        burn_rate = payload['burn_rate']
+        # Campaign is 3 days old: 18.00 over 3 days -> 6.00/day, 82.00 left -> 13.67, floored to 13 days
+        self.assertEqual(burn_rate['window_days'], 3)
+        self.assertEqual(burn_rate['average_daily_spend'], '6.00')
+        self.assertEqual(burn_rate['remaining_budget'], '82.00')
+        self.assertEqual(burn_rate['projected_spend_at_end'], '78.00')  # 18.00 + 10 days x 6.00
+        self.assertEqual(burn_rate['days_to_exhaustion'], 13)
+        self.assertEqual(burn_rate['projected_exhaustion_date'], (today + timezone.timedelta(days=13)).isoformat())
+        self.assertFalse(burn_rate['exhausts_before_end'])
+
+    def test_projected_spend_is_capped_without_recent_spend(self):
+        """
+        With no spend in the window, projected spend at end is still capped at the budget.
+        """
+        self.campaign.used_budget = Decimal('150.00')
+        self.campaign.save()
+
+        burn_rate = burn_rate_projection(self.campaign, timezone.now().date())
+        self.assertIsNone(burn_rate['days_to_exhaustion'])
+        self.assertEqual(burn_rate['projected_spend_at_end'], Decimal('100.00'))
+
+    def test_stats_export_returns_csv(self):
+        """
+        The export endpoint returns one CSV row per rollup day.
+        """
+        self.apply_discount(self.user1, 100)
+        response = self.client.get(reverse('campaign-stats-export', args=[self.campaign.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.reader(StringIO(response.content.decode())))
+        self.assertEqual(rows[0], ['day', 'redemptions', 'unique_customers', 'discount_spent'])
+        self.assertEqual(rows[1][1:], ['1', '1', '10.00'])
+
+
+class UsageCapTest(TestCase):
+    """
+    Test suite for daily/weekly/monthly usage caps backed by CustomerUsageCounter.
+    """
+    def setUp(self):
+        """
+        Create a customer and a campaign with daily, weekly and monthly caps.
+        """
+        self.user1 = User.objects.create(username='user1', email='user1@example.com')
+        self.campaign = Campaign.objects.create(
+            name="Capped Discount",
+            discount_type="cart",
+            discount_value=10,
+            start_date=timezone.now() - timezone.timedelta(days=30),
+            end_date=timezone.now() + timezone.timedelta(days=30),
+            total_budget=1000,
+            daily_usage_limit=2,
+            weekly_usage_limit=3,
+            monthly_usage_limit=4
+        )
+        self.today = timezone.now().date()
+
+    def order(self):
+        return {'subtotal': 100.0, 'delivery_fee': 0.0, 'total': 100.0, 'discount_applied': 0}
+
+    def set_counter(self, **fields):
+        CustomerUsageCounter.objects.filter(campaign=self.campaign, customer=self.user1).update(**fields)
+
+    def test_daily_limit_uses_counter(self):
+        """
+        The third redemption on the same day is rejected.
+        """
+        apply_campaign_discount(self.order(), self.campaign, self.user1)
+        apply_campaign_discount(self.order(), self.campaign, self.user1)
+        with self.assertRaisesMessage(ValidationError, "daily discount limit"):
+            apply_campaign_discount(self.order(), self.campaign, self.user1)
+
+        counter = CustomerUsageCounter.objects.get(campaign=self.campaign, customer=self.user1)
+        self.assertEqual((counter.day_count, counter.week_count, counter.month_count), (2, 2, 2))
+        self.assertEqual(DiscountUsage.objects.get(campaign=self.campaign, customer=self.user1).transaction_count, 2)
+
+    def test_weekly_limit_survives_day_rollover(self):
+        """
+        Yesterday's uses still count towards the weekly cap when they fall in this week.
+        """
+        apply_campaign_discount(self.order(), self.campaign, self.user1)
+        week_start = self.today - timezone.timedelta(days=self.today.weekday())
+        self.set_counter(day=self.today - timezone.timedelta(days=1), day_count=2, week_start=week_start, week_count=3)
+
+        with self.assertRaisesMessage(ValidationError, "weekly discount limit"):
+            apply_campaign_discount(self.order(), self.campaign, self.user1)
+
+    def test_monthly_limit_and_window_reset(self):
+        """
+        The monthly cap applies within the month and resets once the stored month is stale.
+        """
+        apply_campaign_discount(self.order(), self.campaign, self.user1)
+        self.set_counter(day_count=0, week_count=0, month_count=4)
+        with self.assertRaisesMessage(ValidationError, "monthly discount limit"):
+            apply_campaign_discount(self.order(), self.campaign, self.user1)
+
+        last_month = (self.today.replace(day=1) - timezone.timedelta(days=1)).replace(day=1)
+        self.set_counter(month_start=last_month)
+        apply_campaign_discount(self.order(), self.campaign, self.user1)
+        counter = CustomerUsageCounter.objects.get(campaign=self.campaign, customer=self.user1)
+        self.assertEqual(counter.month_start, self.today.replace(day=1))
+        self.assertEqual(counter.month_count, 1)
+
+    def test_benchmark_command_runs(self):
+        """
+        The benchmark command reports both strategies and leaves no data behind.
+        """
+        out = StringIO()
+        call_command('benchmark_usage_caps', '--customers', '3', '--days', '10', '--iterations', '5', stdout=out)
+        self.assertIn("CustomerUsageCounter lookup", out.getvalue())
+        self.assertEqual(Campaign.objects.count(), 1)
+
+    def test_benchmark_command_rejects_non_positive_options(self):
+        """
+        Zero customers, days or iterations are rejected instead of dividing by zero.
+        """
+        for option in ('--customers', '--days', '--iterations'):
+            with self.assertRaisesMessage(CommandError, f"{option} must be a positive integer"):
+                call_command('benchmark_usage_caps', option, '0', stdout=StringIO())
+
+
+def decimal_reference(subtotal, delivery_fee, discount_type, discount_value):
+    """
+    The Decimal computation apply_campaign_discount used before the pricing engine.
+    Returns (discount_applied, unrounded_discount).
+    """
+    subtotal = Decimal(str(subtotal))
+    delivery_fee = Decimal(str(delivery_fee))
+    base = subtotal if discount_type == 'cart' else delivery_fee
+    discount_amount = base * (Decimal(str(discount_value)) / Decimal('100'))
+    return round(discount_amount, 2), discount_amount
+
+
+class PricingEngineTest(SimpleTestCase):
+    """
+    Test suite for the integer-paise pricing engine.
+    Property tests draw random orders and campaigns from a seeded generator.
+    """
+    CASES = 5000
+
+    def random_case(self, rng):
+        subtotal = rng.randint(0, 10 ** 7)         # up to ₹1,00,000.00 in paise
+        delivery_fee = rng.randint(0, 50000)
+        discount_type = rng.choice(['cart', 'delivery'])
+        basis_points = rng.randint(0, 10000)      # 0.00% - 100.00%
+        return subtotal, delivery_fee, discount_type, basis_points
+
+    def test_percentage_matches_decimal_rounding(self):
+        """
+        For any 2dp amounts and percentages, the discount equals round(Decimal, 2)
+        and the total equals subtotal + delivery_fee minus that rounded discount.
+        """
+        rng = random.Random(20250417)
+        for _ in range(self.CASES):
+            subtotal, delivery_fee, discount_type, basis_points = self.random_case(rng)
+            rule = DiscountRule(discount_type, 'percentage', basis_points, None)
+            result = quote(rule, subtotal, delivery_fee)
+
+            # Feed the reference floats, as ApplyDiscountView used to
+            expected, _ = decimal_reference(
+                float(from_paise(subtotal)), float(from_paise(delivery_fee)),
+                discount_type, from_paise(basis_points),
+            )
+            self.assertEqual(from_paise(result.discount), expected)
+            self.assertEqual(from_paise(result.total), from_paise(subtotal + delivery_fee) - expected)
+
+    def test_batched_quotes_match_single_quotes(self):
+        """
+        quote_orders and quote_campaigns return exactly what quote() returns per item.
+        """
+        rng = random.Random(7)
+        cases = [self.random_case(rng) for _ in range(500)]
+        orders = [(subtotal, delivery_fee) for subtotal, delivery_fee, _, _ in cases]
+        rules = [
+            DiscountRule(discount_type, rng.choice(['percentage', 'fixed']), value, rng.choice([None, 5000]))
+            for _, _, discount_type, value in cases
+        ]
+
+        for rule in rules[:20]:
+            self.assertEqual(quote_orders(rule, orders), [quote(rule, *order) for order in orders])
+        for order in orders[:20]:
+            self.assertEqual(quote_campaigns(rules, *order), [quote(rule, *order) for rule in rules])
+
+    def test_fixed_discount_and_caps(self):
+        """
+        Fixed discounts apply as-is, max_discount caps them, and no discount exceeds its base.
+        """
+        self.assertEqual(quote(DiscountRule('cart', 'fixed', 5000, None), 20000, 4000), Quote(5000, 19000))
+        self.assertEqual(quote(DiscountRule('cart', 'percentage', 5000, 3000), 20000, 4000), Quote(3000, 21000))
+        self.assertEqual(quote(DiscountRule('delivery', 'fixed', 5000, None), 20000, 4000), Quote(4000, 20000))
+        # A negative base never yields a negative discount
+        self.assertEqual(quote(DiscountRule('cart', 'fixed', 5000, None), -10000, 0), Quote(0, -10000))
+        self.assertEqual(quote(DiscountRule('cart', 'percentage', 1000, None), -10000, 0), Quote(0, -10000))
+
+    def test_to_paise(self):
+        """
+        Floats, strings and Decimals convert exactly; junk raises ValueError.
+        """
+        self.assertEqual(to_paise(19.99), 1999)
+        self.assertEqual(to_paise('0.1'), 10)
+        self.assertEqual(to_paise(Decimal('250.00')), 25000)
+        self.assertEqual(to_paise('99.990'), 9999)
+        with self.assertRaises(ValueError):
+            to_paise('abc')
+        with self.assertRaises(ValueError):
+            to_paise('99.995')
+
+
+class ApplyDiscountAPITest(TestCase):
+    """
+    Test suite for the apply-discount endpoint using the pricing engine.
+    """
+    def setUp(self):
+        """
+        Initialize API client and a customer; campaigns are created per test.
+        """
+        self.client = APIClient()
+        self.user1 = User.objects.create(username='user1', email='user1@example.com')
+
+    def create_campaign(self, **fields):
+        defaults = dict(
+            name="Discount",
+            discount_type="cart",
+            discount_value=10,
+            start_date=timezone.now() - timezone.timedelta(days=1),
+            end_date=timezone.now() + timezone.timedelta(days=1),
+            total_budget=1000,
+            daily_usage_limit=5
+        )
+        defaults.update(fields)
+        return Campaign.objects.create(**defaults)
+
+    def post(self, campaign, subtotal, delivery_fee):
+        return self.client.post(reverse('apply-discount'), {
+            'subtotal': subtotal,
+            'delivery_fee': delivery_fee,
+            'campaign_id': campaign.id,
+            'customer': self.user1.id,
+        }, format='json')
+
+    def test_percentage_discount_is_exact(self):
+        """
+        12.5% of 99.99 is 12.49875, rounded to 12.50; the total and budget use the same amount.
+        """
+        campaign = self.create_campaign(discount_value=Decimal('12.50'))
+        response = self.post(campaign, '99.99', '40.00')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['discount_applied'], Decimal('12.50'))
+        self.assertEqual(response.data['total'], Decimal('127.49'))
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.used_budget, Decimal('12.50'))
+
+    def test_fixed_delivery_discount_with_cap(self):
+        """
+        A fixed delivery discount is limited by max_discount_amount.
+        """
+        campaign = self.create_campaign(
+            discount_type='delivery', value_type='fixed',
+            discount_value=Decimal('30.00'), max_discount_amount=Decimal('25.00'),
+        )
+        response = self.post(campaign, 200, 40)
+        self.assertEqual(response.data['discount_applied'], Decimal('25.00'))
+        self.assertEqual(response.data['total'], Decimal('215.00'))
+
+    def test_invalid_amount_returns_400(self):
+        """
+        Non-numeric amounts are rejected before any usage is recorded.
+        """
+        campaign = self.create_campaign()
+        response = self.post(campaign, 'abc', 0)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_sub_paisa_amount_returns_400(self):
+        """
+        Amounts finer than one paisa are rejected rather than silently rounded.
+        """
+        campaign = self.create_campaign()
+        response = self.post(campaign, '99.995', 0)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(CustomerUsageCounter.objects.exists())
+
+    def test_negative_amount_returns_400(self):
+        """
+        Negative amounts are rejected before any usage, budget or stats are recorded.
+        """
+        campaign = self.create_campaign(value_type='fixed', discount_value=Decimal('50.00'))
+        for subtotal, delivery_fee in ((-100, 0), (100, -5)):
+            response = self.post(campaign, subtotal, delivery_fee)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.used_budget, Decimal('0'))
+        self.assertFalse(CustomerUsageCounter.objects.exists())
+        self.assertFalse(CampaignDailyStats.objects.exists())
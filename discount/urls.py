@@ -1,9 +1,11 @@
 from django.urls import path
-from .views import CampaignListCreateView, CampaignDetailView, AvailableCampaignsView,ApplyDiscountView
+from .views import CampaignListCreateView, CampaignDetailView, AvailableCampaignsView,ApplyDiscountView, CampaignStatsView, CampaignStatsExportView
 
 urlpatterns = [
     path('campaigns/', CampaignListCreateView.as_view(), name='campaign-list-create'),
     path('campaigns/<int:pk>/', CampaignDetailView.as_view(), name='campaign-detail'),
+    path('campaigns/<int:pk>/stats/', CampaignStatsView.as_view(), name='campaign-stats'),
+    path('campaigns/<int:pk>/stats/export/', CampaignStatsExportView.as_view(), name='campaign-stats-export'),
     path('available-campaigns/', AvailableCampaignsView.as_view(), name='available-campaigns'),
     path('apply-discount/', ApplyDiscountView.as_view(), name='apply-discount'),
 ]
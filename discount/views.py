@@ -1,13 +1,19 @@
+import csv
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.utils import timezone
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.db.models import F, Q
 
-from .models import Campaign,DiscountUsage
-from .serializers import CampaignSerializer
+from .models import Campaign,CustomerUsageCounter,DiscountUsage
+from .serializers import CampaignSerializer, CampaignStatsSerializer
+from .analytics import campaign_stats, record_redemption
+from .pricing import from_paise, quote, rule_for_campaign, to_paise
 
 class CampaignListCreateView(APIView):
     """
@@ -119,44 +125,61 @@ class AvailableCampaignsView(APIView):
         serializer = CampaignSerializer(campaigns, many=True)
         return Response(serializer.data)
 
-from decimal import Decimal
 from rest_framework.exceptions import ValidationError
+
+@transaction.atomic
 def apply_campaign_discount(order, campaign, customer):
     today = timezone.now().date()
 
-    # 1. Get or create today's usage record for the customer
-    usage, created = DiscountUsage.objects.get_or_create(
+    # 1. Lock the customer's usage counter (one indexed lookup covers all limits)
+    day, week_start, month_start = CustomerUsageCounter.window_starts(today)
+    counter, created = CustomerUsageCounter.objects.select_for_update().get_or_create(
         campaign=campaign,
         customer=customer,
-        used_on=today
+        defaults={'day': day, 'week_start': week_start, 'month_start': month_start}
     )
+    counter.roll_to(today)
 
-    # 2. Enforce daily usage limit
-    if usage.transaction_count >= campaign.daily_usage_limit:
+    # 2. Enforce daily, weekly and monthly usage limits
+    if counter.day_count >= campaign.daily_usage_limit:
         raise ValidationError("You’ve reached your daily discount limit.")
+    if campaign.weekly_usage_limit is not None and counter.week_count >= campaign.weekly_usage_limit:
+        raise ValidationError("You’ve reached your weekly discount limit.")
+    if campaign.monthly_usage_limit is not None and counter.month_count >= campaign.monthly_usage_limit:
+        raise ValidationError("You’ve reached your monthly discount limit.")
 
-    # 3. Convert float subtotal/delivery_fee to Decimal
-    subtotal = Decimal(str(order['subtotal']))
-    delivery_fee = Decimal(str(order['delivery_fee']))
-    discount_value = campaign.discount_value
+    # 3. Convert subtotal/delivery_fee to integer paise
+    subtotal = to_paise(order['subtotal'])
+    delivery_fee = to_paise(order['delivery_fee'])
 
     # 4. Calculate discount
-    if campaign.discount_type == 'cart':
-        discount_amount = subtotal * (discount_value / Decimal('100'))
-    else:
-        discount_amount = delivery_fee * (discount_value / Decimal('100'))
+    result = quote(rule_for_campaign(campaign), subtotal, delivery_fee)
+    discount_amount = from_paise(result.discount)
 
     # 5. Apply discount
-    order['discount_applied'] = round(discount_amount, 2)
-    order['total'] = float(subtotal + delivery_fee - discount_amount)
+    order['discount_applied'] = discount_amount
+    order['total'] = from_paise(result.total)
 
-    # 6. Update usage and campaign budget
+    # 6. Update usage counters, today's usage history record and campaign budget
+    counter.day_count += 1
+    counter.week_count += 1
+    counter.month_count += 1
+    counter.save()
+
+    usage, created = DiscountUsage.objects.get_or_create(
+        campaign=campaign,
+        customer=customer,
+        used_on=today
+    )
     usage.transaction_count += 1
     usage.save()
 
     campaign.used_budget += discount_amount
     campaign.save()
 
+    # 7. Update the pre-aggregated daily stats used by the reporting endpoints
+    record_redemption(campaign, today, discount_amount, new_customer=usage.transaction_count == 1)
+
     return order
 class ApplyDiscountView(APIView):
     """
@@ -165,8 +188,14 @@ class ApplyDiscountView(APIView):
     Returns calculated discount and final total.
     """
     def post(self, request):
-        subtotal = float(request.data.get('subtotal', 0))
-        delivery_fee = float(request.data.get('delivery_fee', 0))
+        # Parse amounts straight to integer paise (no float round-trip)
+        try:
+            subtotal = to_paise(request.data.get('subtotal', 0))
+            delivery_fee = to_paise(request.data.get('delivery_fee', 0))
+        except ValueError as exc:
+            return Response({"error": str(exc)}, status=400)
+        if subtotal < 0 or delivery_fee < 0:
+            return Response({"error": "Subtotal and delivery fee must not be negative."}, status=400)
         campaign_id = request.data.get('campaign_id')
         customer = request.data.get('customer')
         customer=User.objects.get(id=customer)
@@ -178,12 +207,52 @@ class ApplyDiscountView(APIView):
 
         # ✅ Create mock order dictionary
         temp_order = {
-            'subtotal': subtotal,
-            'delivery_fee': delivery_fee,
-            'total': subtotal + delivery_fee,  # Initial total before discount
+            'subtotal': from_paise(subtotal),
+            'delivery_fee': from_paise(delivery_fee),
+            'total': from_paise(subtotal + delivery_fee),  # Initial total before discount
             'discount_applied': 0
         }
 
         # ✅ Call the discount logic
         result = apply_campaign_discount(temp_order, campaign, customer)
         return Response(result, status=200)
+
+
+class CampaignStatsView(APIView):
+    """
+    API View returning analytics for a single campaign.
+
+    GET:
+        - Totals, the per-day series and a burn-rate projection, all read
+          from the CampaignDailyStats rollups (no scan of DiscountUsage).
+    """
+    def get(self, request, pk):
+        campaign = get_object_or_404(Campaign, pk=pk)
+        stats = campaign_stats(campaign, timezone.now().date())
+        serializer = CampaignStatsSerializer({
+            'campaign_id': campaign.id,
+            'name': campaign.name,
+            'total_budget': campaign.total_budget,
+            'used_budget': campaign.used_budget,
+            'total_redemptions': stats['total_redemptions'],
+            'total_discount_spent': stats['total_discount_spent'],
+            'burn_rate': stats['burn_rate'],
+            'daily': stats['daily_stats'],
+        })
+        return Response(serializer.data)
+
+
+class CampaignStatsExportView(APIView):
+    """
+    API View exporting a campaign's per-day stats as a CSV file.
+    """
+    def get(self, request, pk):
+        campaign = get_object_or_404(Campaign, pk=pk)
+        response = HttpResponse(content_type='text/csv')
+        response['Content-Disposition'] = f'attachment; filename="campaign_{campaign.id}_stats.csv"'
+
+        writer = csv.writer(response)
+        writer.writerow(['day', 'redemptions', 'unique_customers', 'discount_spent'])
+        for row in campaign.daily_stats.all():
+            writer.writerow([row.day.isoformat(), row.redemptions, row.unique_customers, row.discount_spent])
+        return response